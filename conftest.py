@@ -0,0 +1 @@
+# Root conftest: its presence puts the repo root on sys.path so tests can import `scripts.*`.
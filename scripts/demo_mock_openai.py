@@ -10,8 +10,8 @@ the bottom of the file — do NOT paste your API key into logs or command output
 """
 import asyncio
 import os
-from dotenv import load_dotenv
-from nyra_realtime.openai_manager import OpenAIRealtimeManager
+from nyra_realtime._dotenv_cache import load_env_once
+from nyra_realtime.openai_manager import OpenAIRealtimeManager, bootstrap
 
 
 class MockWS:
@@ -48,9 +48,10 @@ async def run_demo():
         return ws
 
     # Load .env.local if present; this keeps secrets out of the repo while making
-    # the demo convenient for local development. load_dotenv does NOT print
-    # values and will not overwrite already-set environment variables.
-    load_dotenv(".env.local", override=False)
+    # the demo convenient for local development. The file is parsed at most once
+    # per process; it does NOT print values and will not overwrite already-set
+    # environment variables.
+    load_env_once()
 
     mgr = OpenAIRealtimeManager(api_key=os.getenv("OPENAI_API_KEY"), ws_factory=factory)
 
@@ -81,7 +82,7 @@ async def run_demo():
 
 
 if __name__ == "__main__":
-    asyncio.run(run_demo())
+    bootstrap(run_demo())
 
 # --------------------------
 # Notes for wiring real OpenAI realtime transport
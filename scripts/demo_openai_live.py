@@ -12,16 +12,16 @@ Usage:
 This script loads `.env.local` (if present) and requires OPENAI_API_KEY to be set.
 It is intended for manual use only, and will not be executed from tests or CI.
 """
-import asyncio
 import os
-from dotenv import load_dotenv
 
+from nyra_realtime._dotenv_cache import load_env_once
+from nyra_realtime.openai_manager import bootstrap
 from nyra_realtime.openai_transport import make_openai_ws_factory
 
 
 async def main():
     # load local .env safely
-    load_dotenv(".env.local", override=False)
+    load_env_once()
     key = os.getenv("OPENAI_API_KEY")
     if not key:
         print("OPENAI_API_KEY is not set in the environment (.env.local). Aborting.")
@@ -49,4 +49,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    bootstrap(main())
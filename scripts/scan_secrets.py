@@ -13,57 +13,128 @@ Exit codes:
 import sys
 import re
 import math
-from typing import Iterable
+import mmap
+import os
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional, Tuple
 import subprocess
 
 
 MIN_TOKEN_LENGTH = 30
 ENTROPY_THRESHOLD = 4.0
 
-
-def entropy(s: str) -> float:
-    # Shannon entropy per character
+# base-like tokens; compiled once and run over the raw file bytes in a single pass
+TOKEN_CHARS = rb"[A-Za-z0-9\-_+/=]"
+TOKEN_RE = re.compile(TOKEN_CHARS + rb"{16,}")
+
+# Literal prefixes of well-known credentials (OpenAI, GitHub, AWS, Slack, Stripe).
+# They are matched anywhere a word starts, so `api_key=sk-...` is caught even though
+# the surrounding token does not start with the prefix. The word-start check is done
+# in _prefixed_secret rather than with a lookbehind, which would stop `re` from
+# skipping ahead to the literal prefixes and make it try the pattern at every byte.
+KNOWN_PREFIXES = (
+    b"sk-",
+    b"ghp_",
+    b"gho_",
+    b"ghs_",
+    b"ghu_",
+    b"github_pat_",
+    b"AKIA",
+    b"xoxb-",
+    b"xoxp-",
+    b"sk_live_",
+    b"rk_live_",
+)
+PREFIX_RE = re.compile(
+    rb"(?:" + b"|".join(re.escape(p) for p in KNOWN_PREFIXES) + rb")" + TOKEN_CHARS + rb"{16,}"
+)
+PRIVATE_KEY_RE = re.compile(rb"-----BEGIN [A-Z ]*PRIVATE KEY-----")
+
+# Code identifiers and keyword arguments (`name`, `name=Name`) without digits. Long ones
+# score as high entropy, while generated secrets virtually always contain a digit.
+IDENTIFIER_RE = re.compile(rb"[A-Za-z_]+(?:=[A-Za-z_]+)?")
+
+
+def entropy(s: bytes) -> float:
+    # Shannon entropy per byte
     if not s:
         return 0.0
-    freq = {}
-    for ch in s:
-        freq[ch] = freq.get(ch, 0) + 1
-    e = 0.0
-    for v in freq.values():
-        p = v / len(s)
-        e -= p * math.log2(p)
-    return e
+    # count in a single C-level pass, then sum over the distinct symbols only
+    n = len(s)
+    return sum(c / n * math.log2(n / c) for c in Counter(s).values())
 
 
-def tokens_from_line(line: str) -> Iterable[str]:
-    # split on delimiters but keep base-like tokens
-    return re.findall(r"[A-Za-z0-9-_+/=]{16,}", line)
+def _cheap_score(tok: bytes) -> bool:
+    # Entropy over k distinct symbols is at most log2(k), so a token needs more than
+    # 2**ENTROPY_THRESHOLD distinct bytes to pass the entropy check at all. Counting
+    # distinct bytes is much cheaper than the full entropy computation.
+    return len(set(tok)) > 2 ** ENTROPY_THRESHOLD
 
 
-def is_likely_secret_token(tok: str) -> bool:
+def is_likely_secret_token(tok: bytes) -> bool:
     if len(tok) < MIN_TOKEN_LENGTH:
         return False
-    # OpenAI keys start with sk-
-    if tok.startswith("sk-"):
+    # known credential prefixes (OpenAI sk-, GitHub ghp_, AWS AKIA, ...)
+    if tok.startswith(KNOWN_PREFIXES):
         return True
-    # high entropy indicator
-    if entropy(tok) > ENTROPY_THRESHOLD:
+    # high entropy indicator, skipped for tokens too repetitive to qualify and for
+    # plain identifiers such as `default_response_class=ORJSONResponse`
+    if IDENTIFIER_RE.fullmatch(tok):
+        return False
+    if _cheap_score(tok) and entropy(tok) > ENTROPY_THRESHOLD:
         return True
     return False
 
 
-def scan_text(path: str, text: str):
+def _prefixed_secret(data: bytes, start: int, end: int):
+    # first known-prefix secret that starts a word within data[start:end], or None
+    while (m := PREFIX_RE.search(data, start, end)) is not None:
+        pos = m.start()
+        if pos and data[pos - 1 : pos].isalnum():
+            # prefix in the middle of a word; a real one may still follow in this run
+            start = pos + 1
+            continue
+        return m
+    return None
+
+
+def scan_text(path: str, data: bytes):
+    hits = []
+    # private key headers are reported without an entropy check
+    for m in PRIVATE_KEY_RE.finditer(data):
+        hits.append((m.start(), m.group()))
+
+    # A prefixed secret is made of token characters, so it always lies inside one of the
+    # runs TOKEN_RE finds; prefixes are only searched for within those runs.
+    for m in TOKEN_RE.finditer(data):
+        start, end = m.span()
+        prefixed = _prefixed_secret(data, start, end)
+        if prefixed is not None:
+            # reported without an entropy check, and the enclosing run not a second time
+            hits.append((prefixed.start(), prefixed.group()))
+            continue
+        tok = m.group()
+        if is_likely_secret_token(tok):
+            hits.append((start, tok))
+
+    if not hits:
+        return []
+    # a hit's line number is one plus the newlines before it; count them incrementally
+    # between consecutive hits (mmap has no count(), so the gap is sliced out first)
+    hits.sort()
     findings = []
-    for i, line in enumerate(text.splitlines(), start=1):
-        for tok in tokens_from_line(line):
-            if is_likely_secret_token(tok):
-                findings.append((path, i, tok))
+    line, pos = 1, 0
+    for start, tok in hits:
+        line += data[pos:start].count(b"\n")
+        pos = start
+        findings.append((path, line, tok))
     return findings
 
 
 def staged_files():
-    # obtain list of staged files
-    proc = subprocess.run(["git", "diff", "--cached", "--name-only"], capture_output=True, text=True)
+    # obtain list of staged files: added, copied, modified, renamed and type-changed
+    # (deleted paths have no staged content to scan)
+    proc = subprocess.run(["git", "diff", "--cached", "--name-only", "--diff-filter=ACMRT"], capture_output=True, text=True)
     if proc.returncode != 0:
         print("Could not determine staged files")
         sys.exit(2)
@@ -71,26 +142,54 @@ def staged_files():
         yield f
 
 
-def file_contents_from_index(path: str) -> str:
-    # read staged version using git show :path
-    proc = subprocess.run(["git", "show", f":{path}"], capture_output=True, text=True)
-    if proc.returncode != 0:
-        return ""
-    return proc.stdout
-
-
-def main(argv):
-    targets = []
-    if len(argv) > 1:
+def staged_blobs(paths: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+    # read staged versions through a single `git cat-file --batch` process instead
+    # of forking `git show :path` per file
+    proc = subprocess.Popen(["git", "cat-file", "--batch"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        for path in paths:
+            proc.stdin.write(f":{path}\n".encode("utf-8"))
+            proc.stdin.flush()
+            # "<oid> <type> <size>" followed by the contents, or "<name> missing"
+            header = proc.stdout.readline()
+            if header.endswith((b" missing\n", b" ambiguous\n")):
+                yield path, b""
+                continue
+            data = proc.stdout.read(int(header.split()[2]))
+            proc.stdout.read(1)  # trailing newline after the contents
+            yield path, data
+    finally:
+        proc.stdin.close()
+        proc.wait()
+
+
+def mapped_files(paths: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+    # map each file read-only so the regexes scan straight out of the page cache
+    # instead of copying the whole file into a bytes object first
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size == 0:
+                continue  # mmap cannot map an empty file, and there is nothing to scan
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                yield path, mm
+        finally:
+            os.close(fd)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv:
         # files provided explicitly
-        targets = argv[1:]
+        contents = mapped_files(argv)
     else:
-        targets = list(staged_files())
+        contents = staged_blobs(staged_files())
 
+    # scan raw bytes: no decode pass, and no bytes silently dropped by errors="ignore"
     all_findings = []
-    for p in targets:
-        txt = file_contents_from_index(p) if len(argv) == 1 else open(p, "r", encoding="utf-8", errors="ignore").read()
-        findings = scan_text(p, txt)
+    for p, data in contents:
+        findings = scan_text(p, data)
         if findings:
             all_findings.extend(findings)
 
@@ -106,5 +205,4 @@ def main(argv):
 
 
 if __name__ == "__main__":
-    rc = main(sys.argv)
-    sys.exit(rc)
+    sys.exit(main(sys.argv[1:]))
@@ -5,10 +5,15 @@ This script loads `.env.local` (if present) and checks for a small set of
 required environment variables used by Nyra: OPENAI_API_KEY, TWILIO_ACCOUNT_SID,
 TWILIO_AUTH_TOKEN, ADMIN_TOKEN. It returns exit code 0 if all are present, and
 1 otherwise. The script never prints secret values — only names of missing keys.
+
+Usage:
+  PYTHONPATH=./src python scripts/validate_env.py
 """
 import os
 import sys
-from dotenv import load_dotenv
+from typing import List, Optional
+
+from nyra_realtime._dotenv_cache import load_env_once
 
 
 REQUIRED_KEYS = [
@@ -19,9 +24,9 @@ REQUIRED_KEYS = [
 ]
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     # load .env.local without printing or overwriting existing environment
-    load_dotenv(".env.local", override=False)
+    load_env_once()
 
     missing = [k for k in REQUIRED_KEYS if not os.getenv(k)]
     if missing:
@@ -33,4 +38,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,18 @@
+"""Process-wide cache for loading `.env.local`.
+
+`load_dotenv` re-reads and re-parses the file on every call. Scripts and modules that
+want the local environment should call `load_env_once()` so the file is parsed at most
+once per interpreter.
+"""
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_env_once(path: str = ".env.local") -> bool:
+    """Load `path` into os.environ (without overriding existing values) once per process.
+
+    Returns the result of `load_dotenv` — True if at least one variable was set.
+    """
+    return load_dotenv(path, override=False)
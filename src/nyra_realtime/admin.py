@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Header, HTTPException
-from .config import settings
+from .config import ADMIN_TOKEN, APP_NAME
 from pydantic import BaseModel
+import hmac
 import logging
 
 router = APIRouter()
 logger = logging.getLogger("nyra.admin")
 
 def verify_admin(token: str | None):
-    if not token or token != settings.ADMIN_TOKEN:
+    # constant-time compare so response timing does not leak a token prefix
+    if not token or not hmac.compare_digest(token.encode("utf-8"), ADMIN_TOKEN):
         raise HTTPException(status_code=401, detail="invalid admin token")
 
 class ModeRequest(BaseModel):
@@ -23,4 +25,4 @@ async def switch_mode(req: ModeRequest, x_admin_token: str | None = Header(None)
 @router.get("/status")
 async def status(x_admin_token: str | None = Header(None)):
     verify_admin(x_admin_token)
-    return {"status":"ok","app": settings.APP_NAME}
+    return {"status":"ok","app": APP_NAME}
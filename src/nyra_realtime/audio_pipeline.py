@@ -4,8 +4,9 @@ This module provides minimal classes and typed stubs for the real-time audio pip
 The executor agent should replace the internal logic with a production-grade implementation that
 handles Twilio media chunk conversion, jitter buffering, and encoder/decoder pipelines.
 """
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, Deque
 import logging
 
 logger = logging.getLogger("nyra.audio")
@@ -17,18 +18,22 @@ class AudioFrame:
     sample_rate: int = 8000
 
 class JitterBuffer:
-    def __init__(self, max_ms: int = 500):
+    """FIFO of audio frames holding at most `max_ms` of audio.
+
+    When full, pushing a frame drops the oldest one so a stalled reader never
+    makes the buffer grow without bound.
+    """
+    def __init__(self, max_ms: int = 500, frame_ms: int = 20):
         self.max_ms = max_ms
-        self.queue: List[AudioFrame] = []
+        self.frame_ms = frame_ms
+        self.queue: Deque[AudioFrame] = deque(maxlen=max(1, max_ms // frame_ms))
 
     def push(self, frame: AudioFrame):
         self.queue.append(frame)
         logger.debug("JitterBuffer.push", extra={"len": len(self.queue)})
 
     def pop(self) -> Optional[AudioFrame]:
-        if not self.queue:
-            return None
-        return self.queue.pop(0)
+        return self.queue.popleft() if self.queue else None
 
 class Encoder:
     """Encodes PCM frames into a target format for Twilio or OpenAI
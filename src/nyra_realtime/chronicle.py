@@ -2,15 +2,57 @@
 
 This module formats transcripts and provides a stubbed Chronicle integration.
 """
+import asyncio
 import json
+import os
 from typing import Dict, Any
 import logging
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 logger = logging.getLogger("nyra.chronicle")
 BASE = Path("./data")
 BASE.mkdir(exist_ok=True)
 
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _private_opener(path: str, flags: int) -> int:
+    # transcripts may contain caller data; create them readable by the owner only
+    return os.open(path, flags, 0o600)
+
+
+def _write_transcript(path: Path, payload: Dict[str, Any]) -> None:
+    """Write `payload` as one JSON object, serializing `items` one element at a time.
+
+    Peak memory is one serialized item (plus the file buffer) rather than the whole
+    pretty-printed document.
+    """
+    with open(path, "wb", opener=_private_opener) as fh:
+        sep = b"{"
+        for key, value in payload.items():
+            fh.write(sep + _dumps(key) + b":")
+            sep = b","
+            if key != "items":
+                fh.write(_dumps(value))
+                continue
+            fh.write(b"[")
+            for i, item in enumerate(value):
+                if i:
+                    fh.write(b",")
+                fh.write(_dumps(item))
+            fh.write(b"]")
+        fh.write(b"}\n" if payload else b"{}\n")
+
 class TranscriptStore:
     def __init__(self, endpoint: str | None = None):
         self.endpoint = endpoint
@@ -23,15 +65,15 @@ class TranscriptStore:
         }
         return payload
 
-    def save_local(self, call_id: str, payload: Dict[str, Any]):
+    async def save_local(self, call_id: str, payload: Dict[str, Any]):
         path = BASE / f"{call_id}.json"
-        with open(path, "w") as fh:
-            json.dump(payload, fh, indent=2)
+        # file I/O and serialization run in a worker thread so long calls don't stall the loop
+        await asyncio.to_thread(_write_transcript, path, payload)
         logger.info("Saved local transcript", extra={"path": str(path)})
 
-    def ingest(self, call_id: str, payload: Dict[str, Any]):
+    async def ingest(self, call_id: str, payload: Dict[str, Any]):
         if not self.endpoint:
             logger.warning("Chronicle endpoint not configured, using local store")
-            return self.save_local(call_id, payload)
+            return await self.save_local(call_id, payload)
         # TODO: implement HTTP ingestion
         logger.info("Would send to Chronicle", extra={"endpoint": self.endpoint})
@@ -7,6 +7,9 @@ class Settings(BaseSettings):
     ENV: str = "development"
     TWILIO_ACCOUNT_SID: Optional[str]
     TWILIO_AUTH_TOKEN: Optional[str]
+    # public https://host the Twilio webhook is configured with, for signature checks
+    # when a TLS-terminating proxy changes the URL the app sees
+    TWILIO_WEBHOOK_BASE_URL: Optional[str]
     OPENAI_API_KEY: Optional[str]
     CHRONICLE_ENDPOINT: Optional[str]
     ADMIN_TOKEN: str = "replace-me"
@@ -15,3 +18,8 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 settings = Settings()
+
+# Hot fields frozen as plain module constants so request handlers do a single name
+# lookup instead of going through the settings object on every request.
+APP_NAME: str = settings.APP_NAME
+ADMIN_TOKEN: bytes = settings.ADMIN_TOKEN.encode("utf-8")
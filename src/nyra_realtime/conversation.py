@@ -9,19 +9,24 @@ import logging
 
 logger = logging.getLogger("nyra.conv")
 
-@dataclass
+def _now_ms() -> int:
+    # monotonic: immune to wall-clock jumps, and integer-only arithmetic
+    return time.monotonic_ns() // 1_000_000
+
+@dataclass(slots=True)
 class ConversationState:
     call_id: str
     nyra_speaking: bool = False
     caller_speaking: bool = False
-    last_activity_ms: int = field(default_factory=lambda: int(time.time()*1000))
+    # monotonic milliseconds (see _now_ms) — only meaningful relative to other readings
+    last_activity_ms: int = field(default_factory=_now_ms)
     silence_timeout_ms: int = 3000
 
     def update_activity(self):
-        self.last_activity_ms = int(time.time()*1000)
+        self.last_activity_ms = _now_ms()
 
     def is_silence(self) -> bool:
-        return int(time.time()*1000) - self.last_activity_ms > self.silence_timeout_ms
+        return _now_ms() - self.last_activity_ms > self.silence_timeout_ms
 
 class TurnManager:
     def __init__(self):
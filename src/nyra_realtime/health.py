@@ -1,8 +1,8 @@
 from fastapi import APIRouter
-from .config import settings
+from .config import APP_NAME
 
 router = APIRouter()
 
 @router.get("/ping")
 async def ping():
-    return {"status": "ok", "app": settings.APP_NAME}
+    return {"status": "ok", "app": APP_NAME}
@@ -3,11 +3,19 @@
 This file wires up the main API endpoints and includes a small demo mode.
 """
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from .telephony import router as telephony_router
 from .admin import router as admin_router
 from .health import router as health_router
+from .openai_transport import lifespan
 
-app = FastAPI(title="Nyra Realtime Telephony (scaffold)")
+# orjson serializes response bodies several times faster than the stdlib json encoder,
+# which matters for bursts of Twilio webhooks
+app = FastAPI(
+    title="Nyra Realtime Telephony (scaffold)",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.include_router(telephony_router, prefix="/telephony", tags=["telephony"])
 app.include_router(admin_router, prefix="/control", tags=["control"])
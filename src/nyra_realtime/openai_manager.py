@@ -20,12 +20,93 @@ replace the mocked parts with a production WebSocket client (for example using t
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import random
 import time
-from typing import Optional, Callable, Any, Awaitable
+from collections import deque
+from typing import Optional, Callable, Any, Awaitable, Iterator
 
 logger = logging.getLogger("nyra.openai")
 
+# upper bound on frames drained from the send queue per sender wakeup
+SEND_BATCH_MAX = 32
+
+
+def bootstrap(main: Awaitable[Any]) -> Any:
+    """Run `main` to completion, on uvloop when it is installed.
+
+    uvloop is a Unix-only accelerator for the event loop (it is pulled in by
+    `uvicorn[standard]`); without it this is plain `asyncio.run(main)`.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    # a Runner with uvloop's loop factory leaves the process-wide event loop policy
+    # alone, unlike uvloop.install() (which is also deprecated on Python 3.12+)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
+async def _noop_close() -> None:
+    return None
+
+
+def _noop_message(data: bytes) -> None:
+    return None
+
+
+def _make_message_dispatch(callbacks: list[Callable[[bytes], None]]) -> Callable[[bytes], None]:
+    """Build the on_message dispatcher for the current callback list.
+
+    Rebuilt on registration so the receiver loop makes one call per frame, with no
+    iteration or exception handling set up when nothing is registered.
+    """
+    if not callbacks:
+        return _noop_message
+
+    if len(callbacks) == 1:
+        cb = callbacks[0]
+
+        def dispatch_one(data: bytes) -> None:
+            try:
+                cb(data)
+            except Exception:
+                logger.exception("on_message callback failed")
+
+        return dispatch_one
+
+    cbs = tuple(callbacks)
+
+    def dispatch_all(data: bytes) -> None:
+        for cb in cbs:
+            try:
+                cb(data)
+            except Exception:
+                logger.exception("on_message callback failed")
+
+    return dispatch_all
+
+
+class _RemoteClosed(Exception):
+    """Raised by the receiver loop when the transport reports a remote close."""
+
+
+class _Transport:
+    """Bound `send`/`recv`/`close` methods of a connected websocket.
+
+    Built once per connection so the I/O loops call the transport directly instead of
+    re-checking its shape for every frame.
+    """
+
+    __slots__ = ("send", "recv", "close")
+
+    def __init__(self, ws: Any):
+        self.send = ws.send
+        self.recv = ws.recv
+        self.close = getattr(ws, "close", _noop_close)
+
 
 class OpenAIRealtimeManager:
     """Manage a persistent connection to an OpenAI Realtime websocket.
@@ -36,6 +117,17 @@ class OpenAIRealtimeManager:
       `recv` coroutines and an optional `close()`.
     - url: endpoint URL (string) — stored for diagnostics.
     - reconnect_backoff: iterable of seconds to wait between reconnect attempts.
+    - send_hwm / recv_hwm: maximum number of frames held in the send/receive queues.
+      The defaults hold roughly 3 seconds of 20 ms frames. A full receive buffer stops
+      reading from the socket while frames are consumed with `receive_voice`; when
+      frames are only consumed through `register_on_message` callbacks, the oldest
+      buffered frame is dropped instead so the callbacks keep firing.
+    - drop_oldest: when the send queue is full, drop the oldest queued frame (real-time
+      audio semantics) instead of raising asyncio.QueueFull from `send_audio`.
+    - coalesce_frames: send each drained batch of queued frames as one fragmented
+      websocket message (one fragment per frame, a single `send` call). Only enable this
+      when the remote treats the stream as continuous, e.g. raw PCM, because the frame
+      boundaries are not visible on the receiving side.
     """
 
     def __init__(
@@ -44,6 +136,10 @@ class OpenAIRealtimeManager:
         ws_factory: Optional[Callable[[], Awaitable[Any]]] = None,
         url: str | None = None,
         reconnect_backoff: Optional[list[float]] = None,
+        send_hwm: int = 160,
+        recv_hwm: int = 160,
+        drop_oldest: bool = True,
+        coalesce_frames: bool = False,
     ):
         self.api_key = api_key
         self.url = url or "wss://api.openai.com/v1/realtime"
@@ -51,24 +147,39 @@ class OpenAIRealtimeManager:
 
         # connection state
         self._ws = None
+        self._transport: Optional[_Transport] = None
         self.connected = False
-
-        # async queues for I/O
-        self._send_queue: asyncio.Queue[bytes] = asyncio.Queue()
-        self._recv_queue: asyncio.Queue[bytes] = asyncio.Queue()
-
-        # background tasks
-        self._sender_task: Optional[asyncio.Task] = None
-        self._receiver_task: Optional[asyncio.Task] = None
+        # set whenever the connection goes down, so run_forever can sleep until then
+        self._disconnected_event = asyncio.Event()
+
+        # bounded async queue for outgoing audio
+        self._send_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=send_hwm)
+        self.drop_oldest = drop_oldest
+        self.coalesce_frames = coalesce_frames
+
+        # incoming frames: `receive_voice` is the only consumer, so a deque plus a
+        # pair of futures replaces asyncio.Queue's getter/putter bookkeeping. A full
+        # buffer stops the receiver from reading the socket so backpressure reaches
+        # the remote through TCP, unless only callbacks consume the frames.
+        self.recv_hwm = recv_hwm
+        self._recv_buf: deque[bytes] = deque()
+        self._recv_pulled = False
+        self._recv_waiter: Optional[asyncio.Future] = None
+        self._recv_drained: Optional[asyncio.Future] = None
+
+        # background task running both the sender and receiver loops
+        self._io_task: Optional[asyncio.Task] = None
 
         # reconnect logic
-        self.reconnect_backoff = reconnect_backoff or [0.1, 0.2, 0.5, 1.0]
+        self.reconnect_backoff = tuple(reconnect_backoff or (0.1, 0.2, 0.5, 1.0))
+        self._backoff_iter = self._new_backoff_iter()
         self._stop_event: Optional[asyncio.Event] = None
 
         # event callbacks
         self._on_connected: list[Callable[[], None]] = []
         self._on_disconnected: list[Callable[[Optional[Exception]], None]] = []
         self._on_message: list[Callable[[bytes], None]] = []
+        self._on_message_dispatch: Callable[[bytes], None] = _noop_message
 
         # internal bookkeeping
         self._connect_attempts = 0
@@ -93,12 +204,12 @@ class OpenAIRealtimeManager:
 
         self._ws = await self.ws_factory()
         # the returned object is expected to implement async send/recv and close()
+        self._transport = _Transport(self._ws)
         self.connected = True
+        self._disconnected_event.clear()
 
-        # start background tasks
-        loop = asyncio.get_running_loop()
-        self._sender_task = loop.create_task(self._sender_loop())
-        self._receiver_task = loop.create_task(self._receiver_loop())
+        # start background I/O
+        self._io_task = asyncio.get_running_loop().create_task(self._run_io())
 
         for cb in self._on_connected:
             try:
@@ -110,46 +221,65 @@ class OpenAIRealtimeManager:
         """Gracefully stop background tasks and close the transport."""
         logger.info("OpenAIRealtimeManager.disconnect")
         self.connected = False
+        self._disconnected_event.set()
 
-        # cancel background tasks
-        if self._sender_task:
-            self._sender_task.cancel()
-            self._sender_task = None
-        if self._receiver_task:
-            self._receiver_task.cancel()
-            self._receiver_task = None
+        # cancel background I/O (the task group cancels both loops) and let it unwind
+        if self._io_task:
+            io_task, self._io_task = self._io_task, None
+            io_task.cancel()
+            await asyncio.wait({io_task})
 
         # close transport
         try:
-            if self._ws and hasattr(self._ws, "close"):
-                maybe = self._ws.close()
+            if self._transport is not None:
+                maybe = self._transport.close()
                 if asyncio.iscoroutine(maybe):
                     await maybe
         except Exception as exc:  # pragma: no cover - defensive
             logger.exception("error while closing websocket: %s", exc)
 
         self._ws = None
+        self._transport = None
 
-        for cb in self._on_disconnected:
-            try:
-                cb(None)
-            except Exception:
-                logger.exception("on_disconnected callback failed")
+        self._notify_disconnected(None)
 
     async def send_audio(self, data: bytes) -> None:
         """Queue audio bytes to be sent to the realtime API.
 
-        This is non-blocking — the background sender loop drains the queue.
+        This is non-blocking — the background sender loop drains the queue. If the
+        queue is full the oldest frame is dropped, or asyncio.QueueFull is raised when
+        the manager was created with `drop_oldest=False`.
         """
-        await self._send_queue.put(data)
+        try:
+            self._send_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            if not self.drop_oldest:
+                raise
+            self._send_queue.get_nowait()
+            self._send_queue.task_done()
+            self._send_queue.put_nowait(data)
+            logger.debug("send queue full — dropped oldest frame")
 
     async def receive_voice(self, timeout: Optional[float] = None) -> bytes:
         """Await the next received voice/audio chunk from the realtime endpoint.
 
         Returns bytes and may raise asyncio.TimeoutError if a timeout is provided.
         """
-        data = await asyncio.wait_for(self._recv_queue.get(), timeout) if timeout else await self._recv_queue.get()
-        self._recv_queue.task_done()
+        self._recv_pulled = True
+        if not self._recv_buf:
+            self._recv_waiter = asyncio.get_running_loop().create_future()
+            try:
+                if timeout:
+                    await asyncio.wait_for(self._recv_waiter, timeout)
+                else:
+                    await self._recv_waiter
+            finally:
+                self._recv_waiter = None
+
+        data = self._recv_buf.popleft()
+        drained = self._recv_drained
+        if drained is not None and not drained.done():
+            drained.set_result(None)
         return data
 
     def register_on_connected(self, cb: Callable[[], None]) -> None:
@@ -160,134 +290,149 @@ class OpenAIRealtimeManager:
 
     def register_on_message(self, cb: Callable[[bytes], None]) -> None:
         self._on_message.append(cb)
+        self._on_message_dispatch = _make_message_dispatch(self._on_message)
 
     # ----------------
     # background control
     # ----------------
+    def _notify_disconnected(self, exc: Optional[Exception]) -> None:
+        for cb in self._on_disconnected:
+            try:
+                cb(exc)
+            except Exception:
+                logger.exception("on_disconnected callback failed")
+
+    async def _run_io(self) -> None:
+        """Run the sender and receiver loops as one unit of work.
+
+        The task group cancels the sibling loop as soon as either one fails, and
+        `disconnect` only has to cancel this task. Errors and remote closes are turned
+        into a single disconnect notification here.
+        """
+        error: Optional[Exception] = None
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._sender_loop())
+                tg.create_task(self._receiver_loop())
+        except* _RemoteClosed:
+            logger.info("transport closed remote end")
+        except* Exception as group:
+            error = group.exceptions[0]
+            logger.error("realtime I/O error: %s", error, exc_info=error)
+
+        self.connected = False
+        self._disconnected_event.set()
+        self._notify_disconnected(error)
+
     async def _sender_loop(self) -> None:
         """Continuously pull from send queue and write to transport.
 
-        If an error occurs the loop will end and the manager will mark disconnected.
+        Frames that are already queued when the loop wakes up are drained in one batch
+        (up to SEND_BATCH_MAX) so a burst costs a single queue wait. Each frame is sent
+        as its own websocket message unless `coalesce_frames` is enabled, in which case
+        the batch goes out as the fragments of one message from a single `send` call.
+
+        Transport errors propagate to `_run_io`, which tears down the connection.
         """
-        assert self._ws is not None, "sender started without transport"
-        try:
-            while self.connected:
-                frame = await self._send_queue.get()
+        send = self._transport.send
+        while True:
+            frames = [await self._send_queue.get()]
+            while len(frames) < SEND_BATCH_MAX:
                 try:
-                    if hasattr(self._ws, "send"):
-                        send_coro = self._ws.send(frame)
-                        if asyncio.iscoroutine(send_coro):
-                            await send_coro
-                    else:
-                        logger.debug("ws has no send() method — dropping frame")
-                except asyncio.CancelledError:
-                    raise
-                except Exception as exc:
-                    logger.exception("sender loop error: %s", exc)
-                    # signal disconnect and break — receiver task will also exit
-                    self.connected = False
-                    for cb in self._on_disconnected:
-                        try:
-                            cb(exc)
-                        except Exception:
-                            logger.exception("on_disconnected callback failed")
+                    frames.append(self._send_queue.get_nowait())
+                except asyncio.QueueEmpty:
                     break
-                finally:
-                    try:
-                        self._send_queue.task_done()
-                    except Exception:
-                        pass
-        except asyncio.CancelledError:
-            logger.info("sender loop cancelled")
+            try:
+                if self.coalesce_frames and len(frames) > 1:
+                    # websockets sends an iterable as one fragmented message
+                    await send(frames)
+                else:
+                    for frame in frames:
+                        await send(frame)
+            finally:
+                for _ in frames:
+                    self._send_queue.task_done()
 
     async def _receiver_loop(self) -> None:
-        """Continuously receive frames and place into the recv queue.
+        """Continuously receive frames and place into the recv buffer.
 
         The loop expects the transport to provide an async `recv()` and will push raw
-        bytes into the recv queue. Any message handlers are called synchronously in a
-        safe manner (exceptions are logged and swallowed).
+        bytes into the recv buffer. Any message handlers are called synchronously in a
+        safe manner (exceptions are logged and swallowed). A `None` frame means the
+        remote end closed; transport errors propagate to `_run_io`.
         """
-        assert self._ws is not None, "receiver started without transport"
+        recv = self._transport.recv
+        while True:
+            # stop reading the socket while the `receive_voice` consumer is behind
+            while len(self._recv_buf) >= self.recv_hwm and (self._recv_pulled or not self._on_message):
+                self._recv_drained = asyncio.get_running_loop().create_future()
+                await self._recv_drained
+            self._recv_drained = None
+
+            result = await recv()
+            if result is None:
+                raise _RemoteClosed()
+
+            # hand the frame to the consumer and notify callbacks
+            self._recv_buf.append(result)
+            if len(self._recv_buf) > self.recv_hwm:
+                # only callbacks consume frames, and they saw the oldest one already
+                self._recv_buf.popleft()
+            waiter = self._recv_waiter
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+            self._on_message_dispatch(result)
+
+    async def _wait_disconnected(self, stop_event: asyncio.Event) -> None:
+        """Return once the connection drops or `stop_event` is set, without polling."""
+        waiters = {
+            asyncio.ensure_future(self._disconnected_event.wait()),
+            asyncio.ensure_future(stop_event.wait()),
+        }
         try:
-            while self.connected:
-                try:
-                    if hasattr(self._ws, "recv"):
-                        result = await self._ws.recv()
-                    else:
-                        # nothing to receive; sleep and continue
-                        await asyncio.sleep(0.01)
-                        continue
-
-                    if result is None:
-                        # treat None as remote close
-                        logger.info("transport closed remote end")
-                        self.connected = False
-                        for cb in self._on_disconnected:
-                            try:
-                                cb(None)
-                            except Exception:
-                                logger.exception("on_disconnected callback failed")
-                        break
-
-                    # push into queue and notify callbacks
-                    await self._recv_queue.put(result)
-                    for cb in self._on_message:
-                        try:
-                            cb(result)
-                        except Exception:
-                            logger.exception("on_message callback failed")
-
-                except asyncio.CancelledError:
-                    raise
-                except Exception as exc:
-                    logger.exception("receiver loop error: %s", exc)
-                    # break out and flag disconnected
-                    self.connected = False
-                    for cb in self._on_disconnected:
-                        try:
-                            cb(exc)
-                        except Exception:
-                            logger.exception("on_disconnected callback failed")
-                    break
-        except asyncio.CancelledError:
-            logger.info("receiver loop cancelled")
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    def _new_backoff_iter(self) -> Iterator[float]:
+        """Walk the backoff schedule once, then keep repeating its last (longest) step."""
+        return itertools.chain(self.reconnect_backoff, itertools.repeat(self.reconnect_backoff[-1]))
 
     async def run_forever(self, stop_event: asyncio.Event) -> None:
         """Run a connect/reconnect loop until stop_event is set.
 
         The manager will try to maintain a live connection, applying the configured
-        backoff schedule between attempts.
+        backoff schedule between attempts. Each wait is jittered by ±50% so managers
+        that lose their connections together don't reconnect in lockstep.
         """
         self._stop_event = stop_event
-        backoff_index = 0
         while not stop_event.is_set():
             try:
                 await self.connect()
-                # connected — wait until disconnected or stop event
-                while self.connected and not stop_event.is_set():
-                    await asyncio.sleep(0.05)
-                # if disconnected, loop to reconnect
-                backoff_index = 0
+                # a successful connect restarts the backoff schedule
+                self._backoff_iter = self._new_backoff_iter()
+                # connected — sleep until disconnected or stop event
+                await self._wait_disconnected(stop_event)
             except Exception as exc:
                 logger.exception("connect attempt failed: %s", exc)
                 # call disconnect handlers
                 self.connected = False
-                for cb in self._on_disconnected:
-                    try:
-                        cb(exc)
-                    except Exception:
-                        logger.exception("on_disconnected callback failed")
+                self._notify_disconnected(exc)
 
-            # apply backoff
             if stop_event.is_set():
                 break
 
+            # apply backoff, waking early if asked to stop
+            wait = next(self._backoff_iter) * random.uniform(0.5, 1.5)
+            try:
+                await asyncio.wait_for(stop_event.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
         # make sure we perform a graceful disconnect/cleanup when the run loop exits
         try:
             await self.disconnect()
         except Exception:
             logger.exception("error during shutdown cleanup")
-            wait = self.reconnect_backoff[min(backoff_index, len(self.reconnect_backoff) - 1)]
-            backoff_index += 1
-            await asyncio.sleep(wait)
 
@@ -12,11 +12,46 @@ factory function does not print or log sensitive values. It will raise when
 """
 from __future__ import annotations
 
-from typing import Optional, Callable, Awaitable, Any
+from contextlib import asynccontextmanager
+from typing import Optional, Callable, Awaitable, Any, AsyncIterator, Dict, Tuple
+from urllib.parse import urlsplit
+import asyncio
 import logging
+import socket
+import ssl
+import time
+import weakref
+
+from fastapi import HTTPException
+from fastapi.requests import HTTPConnection
+
+from .config import settings
 
 logger = logging.getLogger("nyra.openai.transport")
 
+# One TLS context for every connection: loading the CA bundle is the expensive part
+# of building a context, and reconnects would otherwise repeat it each time.
+_SSL_CTX = ssl.create_default_context()
+
+# Resolved addresses per (host, port), so reconnects to the fixed realtime endpoint skip
+# the DNS round-trip. Every address getaddrinfo returned is kept, in order, so a
+# connection can fall back from an unreachable one (e.g. IPv6 on an IPv4-only network)
+# just as create_connection does for a host name. Entries expire after _DNS_TTL seconds
+# and are dropped as soon as no cached address accepts a connection.
+_DNS_TTL = 60.0
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[float, Tuple[str, ...]]] = {}
+
+
+async def _resolve(host: str, port: int) -> Tuple[str, ...]:
+    now = time.monotonic()
+    cached = _DNS_CACHE.get((host, port))
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    addrs = tuple(dict.fromkeys(info[4][0] for info in infos))
+    _DNS_CACHE[(host, port)] = (now + _DNS_TTL, addrs)
+    return addrs
+
 
 def make_openai_ws_factory(api_key: Optional[str], url: Optional[str] = None) -> Callable[[], Awaitable[Any]]:
     """Return an async callable that creates a connected websocket client.
@@ -39,15 +74,91 @@ def make_openai_ws_factory(api_key: Optional[str], url: Optional[str] = None) ->
 
     endpoint = url or "wss://api.openai.com/v1/realtime"
 
-    async def factory() -> Any:
-        # Use a conservative set of headers; avoid logging the key itself.
-        headers = (
-            ("Authorization", f"Bearer {api_key}"),
-            ("User-Agent", "nyra-realtime/1.0"),
-        )
+    # Use a conservative set of headers; avoid logging the key itself. Built once so
+    # each factory() call during a reconnect storm allocates nothing up front.
+    headers = (
+        ("Authorization", f"Bearer {api_key}"),
+        ("User-Agent", "nyra-realtime/1.0"),
+    )
+    # Keyword arguments are fixed for the factory's lifetime, so the dict is built once.
+    # websockets rejects an ssl argument for plain ws:// endpoints (e.g. local mocks).
+    secure = endpoint.startswith("wss://")
+    connect_kw = {
+        "extra_headers": headers,
+        "ssl": _SSL_CTX if secure else None,
+        # audio payloads are already compressed; permessage-deflate only burns CPU
+        "compression": None,
+    }
+    parts = urlsplit(endpoint)
+    hostname = parts.hostname or ""
+    port = parts.port or (443 if secure else 80)
+    if secure:
+        # we connect to a resolved address, so SNI and certificate checks need the name
+        connect_kw["server_hostname"] = hostname
 
+    async def factory() -> Any:
         logger.info("Opening websocket to OpenAI realtime endpoint")
-        ws = await websockets.connect(endpoint, extra_headers=headers)
-        return ws
+        key = (hostname, port)
+        addrs = await _resolve(hostname, port)
+        errors = []
+        for addr in addrs:
+            try:
+                ws = await websockets.connect(endpoint, host=addr, port=port, **connect_kw)
+            except OSError as exc:
+                errors.append(exc)
+                continue
+            cached = _DNS_CACHE.get(key)
+            if addr != addrs[0] and cached is not None and cached[1] == addrs:
+                # try the address that worked first next time
+                _DNS_CACHE[key] = (cached[0], (addr,) + tuple(a for a in addrs if a != addr))
+            return ws
+        # no cached address accepted a connection; resolve again on the next attempt
+        _DNS_CACHE.pop(key, None)
+        raise errors[-1]
+
+    return factory
+
 
+@asynccontextmanager
+async def lifespan(app: Any) -> AsyncIterator[None]:
+    """FastAPI lifespan that shares one OpenAI websocket factory across the app.
+
+    The factory is stored on `app.state.openai_ws_factory` (None when OPENAI_API_KEY is
+    not configured); handlers get it through `get_openai_ws_factory`. Websockets it
+    opened that are still alive at shutdown are closed.
+    """
+    open_sockets: "weakref.WeakSet[Any]" = weakref.WeakSet()
+    factory: Optional[Callable[[], Awaitable[Any]]] = None
+
+    if settings.OPENAI_API_KEY:
+        connect = make_openai_ws_factory(settings.OPENAI_API_KEY)
+
+        async def tracked_factory() -> Any:
+            ws = await connect()
+            open_sockets.add(ws)
+            return ws
+
+        factory = tracked_factory
+
+    app.state.openai_ws_factory = factory
+    try:
+        yield
+    finally:
+        for ws in list(open_sockets):
+            try:
+                await ws.close()
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("error while closing websocket")
+
+
+def get_openai_ws_factory(conn: HTTPConnection) -> Callable[[], Awaitable[Any]]:
+    """FastAPI dependency returning the app's shared OpenAI websocket factory.
+
+    Handlers that open realtime sessions (such as the Twilio Media Streams bridge) should
+    take their factory from here rather than calling `make_openai_ws_factory`, so their
+    sockets are closed at shutdown. Responds 503 when OPENAI_API_KEY is not configured.
+    """
+    factory = conn.app.state.openai_ws_factory
+    if factory is None:
+        raise HTTPException(status_code=503, detail="OpenAI not configured")
     return factory
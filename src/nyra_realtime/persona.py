@@ -1,18 +1,34 @@
 """Persona configuration, modes, and session injection."""
-from pydantic import BaseModel
-from typing import Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, replace
+from typing import Dict, Any, Final, Tuple
 import yaml
+import mmap
 import os
 from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parent
+try:
+    # LibYAML-backed loader; PyYAML's binary wheels ship with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
-class Persona(BaseModel):
+# built once at import; no resolve() — the path is only used to open the file
+_DEFAULT_PATH: Final[Path] = Path(__file__).parent / "personas.yaml"
+
+@dataclass(frozen=True, slots=True)
+class Persona:
+    # plain dataclass: personas come from our own trusted YAML, so there is no
+    # per-instance validation pass to pay for
     name: str
     description: str
-    voice: Dict[str, Any] = {}
+    voice: Dict[str, Any] = field(default_factory=dict)
     mode: str = "assistant"
 
+# YAML keys Persona accepts; anything else in a persona entry is ignored, as it was
+# when Persona was a pydantic model
+_PERSONA_FIELDS: Final = frozenset(f.name for f in fields(Persona))
+
 DEFAULT_PERSONA = Persona(
     name="Nyra",
     description="Nyra, AI assistant to Tom — always transparent about identity.",
@@ -20,17 +36,54 @@ DEFAULT_PERSONA = Persona(
     mode="assistant",
 )
 
-def load_personas(path: str | None = None):
-    config_path = Path(path or BASE_DIR / "personas.yaml")
-    if not config_path.exists():
+# Parsed persona files keyed by absolute path, validated against (mtime_ns, size) so an
+# edited file is re-read. Bounded LRU: least recently used entries are evicted first.
+_PERSONA_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Persona]]]" = OrderedDict()
+_PERSONA_CACHE_MAX = 32
+
+def _copy_personas(personas: Dict[str, Persona]) -> Dict[str, Persona]:
+    # Persona is frozen but its voice dict is not; each caller gets its own copy so a
+    # mutation can't leak into the cache
+    return {k: replace(p, voice=dict(p.voice)) for k, p in personas.items()}
+
+def load_personas(path: str | os.PathLike | None = None):
+    config_path = _DEFAULT_PATH if path is None else Path(path)
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return {"default": DEFAULT_PERSONA}
+
+    # abspath() joins a relative path onto the current directory (no filesystem access),
+    # so the same relative path used from different directories gets separate entries
+    key = os.path.abspath(config_path)
+    cached = _PERSONA_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _PERSONA_CACHE.move_to_end(key)
+        return _copy_personas(cached[2])
+
+    if st.st_size == 0:
+        # nothing to parse, and mmap cannot map an empty file
         return {"default": DEFAULT_PERSONA}
-    with open(config_path, "r") as fh:
-        content = yaml.safe_load(fh)
-    result = {k: Persona(**v) for k, v in content.items()}
-    return result
+
+    # libyaml reads the raw bytes straight out of the page cache; no text-mode decode
+    with open(config_path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = yaml.load(mm, Loader=_YamlLoader)
+    if content is None:
+        # only whitespace or comments
+        return {"default": DEFAULT_PERSONA}
+    result = {
+        k: Persona(**{f: value for f, value in v.items() if f in _PERSONA_FIELDS})
+        for k, v in content.items()
+    }
+
+    _PERSONA_CACHE[key] = (st.st_mtime_ns, st.st_size, result)
+    _PERSONA_CACHE.move_to_end(key)
+    if len(_PERSONA_CACHE) > _PERSONA_CACHE_MAX:
+        _PERSONA_CACHE.popitem(last=False)
+    return _copy_personas(result)
 
 # Mode switching helper
-VALID_MODES = ["assistant", "legal", "warm", "task"]
+VALID_MODES = frozenset(("assistant", "legal", "warm", "task"))
 
 def is_valid_mode(mode: str) -> bool:
     return mode in VALID_MODES
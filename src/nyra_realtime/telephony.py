@@ -1,12 +1,95 @@
-from fastapi import APIRouter, Request, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Header, Request, HTTPException
+from typing import Mapping
 from .config import settings
+import base64
+import binascii
+import hashlib
+import hmac
 import logging
+import msgspec
 
 router = APIRouter()
 logger = logging.getLogger("nyra.telephony")
 
-class TwilioWebhook(BaseModel):
+# HMAC-SHA1 keyed with the Twilio auth token, built once. Each request works on a
+# .copy(), which reuses the already-keyed hash state instead of re-deriving it.
+_TWILIO_HMAC = (
+    hmac.new(settings.TWILIO_AUTH_TOKEN.encode("utf-8"), digestmod=hashlib.sha1)
+    if settings.TWILIO_AUTH_TOKEN
+    else None
+)
+
+# Scheme and host Twilio signs webhook URLs with. Behind a proxy that terminates TLS the
+# app sees http://internal-host/..., which would never match Twilio's signature.
+_PUBLIC_BASE_URL = (settings.TWILIO_WEBHOOK_BASE_URL or "").rstrip("/")
+
+def _signed_url(request: Request) -> str:
+    """The URL Twilio signed: the request URL, on the public base URL when configured."""
+    if not _PUBLIC_BASE_URL:
+        return str(request.url)
+    query = request.url.query
+    return _PUBLIC_BASE_URL + request.url.path + ("?" + query if query else "")
+
+def verify_twilio_signature(url: str, params: Mapping[str, str], signature: str | None) -> bool:
+    """Check an X-Twilio-Signature header against the request URL and POST params.
+
+    Twilio signs the full URL followed by each POST parameter name and value, sorted by
+    name, with HMAC-SHA1 keyed by the account's auth token (base64-encoded).
+    """
+    if _TWILIO_HMAC is None or not signature:
+        return False
+    try:
+        expected = base64.b64decode(signature, validate=True)
+    except binascii.Error:
+        return False
+    h = _TWILIO_HMAC.copy()
+    h.update(url.encode("utf-8"))
+    for key in sorted(params):
+        h.update(key.encode("utf-8"))
+        h.update(params[key].encode("utf-8"))
+    return hmac.compare_digest(h.digest(), expected)
+
+async def verify_twilio_request(request: Request, x_twilio_signature: str | None = Header(None)) -> None:
+    """Reject webhooks that were not signed by Twilio (enabled once TWILIO_AUTH_TOKEN is set).
+
+    For JSON bodies Twilio signs only the URL, which carries a `bodySHA256` query
+    parameter; the body is checked against that hash. The webhook only accepts JSON, so
+    a request without `bodySHA256` has an unsigned body and is rejected.
+
+    Behind a TLS-terminating proxy either set TWILIO_WEBHOOK_BASE_URL to the public
+    base URL or run uvicorn with `--proxy-headers --forwarded-allow-ips=<proxy>`, so
+    the URL checked here is the one Twilio signed.
+    """
+    if _TWILIO_HMAC is None:
+        return
+    if not verify_twilio_signature(_signed_url(request), {}, x_twilio_signature):
+        raise HTTPException(status_code=403, detail="invalid Twilio signature")
+    body_sha256 = request.query_params.get("bodySHA256")
+    if body_sha256 is None:
+        raise HTTPException(status_code=403, detail="invalid Twilio signature")
+    digest = hashlib.sha256(await request.body()).hexdigest()
+    if not hmac.compare_digest(digest, body_sha256):
+        raise HTTPException(status_code=403, detail="invalid Twilio signature")
+
+def msgspec_body(model: type):
+    """Dependency that decodes the JSON request body straight into a msgspec Struct.
+
+    Skips FastAPI's json.loads + pydantic validation for these small, hot payloads.
+    Malformed or invalid bodies are rejected with 422 like FastAPI's own validation.
+    """
+    decoder = msgspec.json.Decoder(model)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+
+    return decode
+
+# Request bodies are read-only and hold only strings, so they can be frozen and left
+# out of the cyclic GC's tracking. Unknown fields are ignored by msgspec by default.
+class TwilioWebhook(msgspec.Struct, frozen=True, gc=False):
     call_sid: str
     account_sid: str | None = None
     direction: str | None = None
@@ -14,26 +97,27 @@ class TwilioWebhook(BaseModel):
     to_phone: str | None = None
     media_stream_id: str | None = None
 
-@router.post("/webhook")
-async def twilio_webhook(body: TwilioWebhook):
+@router.post("/webhook", dependencies=[Depends(verify_twilio_request)])
+async def twilio_webhook(body: TwilioWebhook = Depends(msgspec_body(TwilioWebhook))):
     """Twilio will call this webhook to notify of an inbound call or event.
 
-    This stub accepts a Twilio-like JSON payload and returns a placeholder response. It should be replaced with full Twilio
-    webhook verification and Media Streams handshake.
+    This stub accepts a Twilio-like JSON payload and returns a placeholder response. Requests are signature-checked by
+    `verify_twilio_request`; the Media Streams handshake is still to be implemented.
     """
-    logger.info("Received Twilio webhook event", extra={"call_sid": body.call_sid, "direction": body.direction})
-    # TODO: verify Twilio signature (X-Twilio-Signature header)
+    # build the LogRecord extras only when INFO is actually enabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Received Twilio webhook event", extra={"call_sid": body.call_sid, "direction": body.direction})
 
     # Minimum allowed operations for now
     return {"status": "accepted", "call_sid": body.call_sid}
 
-class OutboundRequest(BaseModel):
+class OutboundRequest(msgspec.Struct, frozen=True, gc=False):
     to: str
     from_phone: str
     twiml_url: str | None = None
 
 @router.post("/call/outbound")
-async def create_outbound(req: OutboundRequest):
+async def create_outbound(req: OutboundRequest = Depends(msgspec_body(OutboundRequest))):
     """Initiate an outbound call via Twilio API (stub).
 
     This will return a mocked call ID. Executor agent should replace with live Twilio REST integration.
@@ -43,5 +127,6 @@ async def create_outbound(req: OutboundRequest):
 
     # TODO: call Twilio REST API to create call and attach Media Stream
     fake_call_sid = "CALL-FAKE-12345"
-    logger.info("Initiated outbound call", extra={"to": req.to, "from": req.from_phone})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Initiated outbound call", extra={"to": req.to, "from": req.from_phone})
     return {"call_sid": fake_call_sid, "status":"initiated"}
@@ -1,24 +1,96 @@
+import pytest
 from fastapi.testclient import TestClient
 from nyra_realtime.main import app
 
-client = TestClient(app)
 
-def test_readiness():
+@pytest.fixture(scope="session")
+def client():
+    # entering the client runs the app lifespan once for the whole session
+    with TestClient(app) as c:
+        yield c
+
+
+def test_readiness(client):
     r = client.get("/ready")
     assert r.status_code == 200
     assert r.json()["status"] == "ok"
 
-def test_health_ping():
+def test_health_ping(client):
     r = client.get("/health/ping")
     assert r.status_code == 200
     assert "app" in r.json()
 
-def test_admin_unauthorized():
+def test_admin_unauthorized(client):
     r = client.get("/control/status")
     assert r.status_code == 401
 
-def test_twilio_webhook():
+@pytest.fixture
+def unsigned_webhooks(monkeypatch):
+    # signature checks turn on when TWILIO_AUTH_TOKEN is set in the environment
+    from nyra_realtime import telephony
+    monkeypatch.setattr(telephony, "_TWILIO_HMAC", None)
+
+def test_twilio_webhook(client, unsigned_webhooks):
     payload = {"call_sid": "CS1", "direction": "inbound"}
     r = client.post("/telephony/webhook", json=payload)
     assert r.status_code == 200
     assert r.json()["call_sid"] == "CS1"
+
+def test_admin_wrong_token(client):
+    r = client.get("/control/status", headers={"x-admin-token": "not-the-token"})
+    assert r.status_code == 401
+
+def test_admin_authorized(client):
+    from nyra_realtime.config import settings
+    r = client.get("/control/status", headers={"x-admin-token": settings.ADMIN_TOKEN})
+    assert r.status_code == 200
+
+def test_twilio_webhook_rejects_invalid_body(client, unsigned_webhooks):
+    r = client.post("/telephony/webhook", json={"direction": "inbound"})
+    assert r.status_code == 422
+
+def test_twilio_webhook_signature(client, monkeypatch):
+    import base64
+    import hashlib
+    import hmac
+    from nyra_realtime import telephony
+
+    monkeypatch.setattr(telephony, "_TWILIO_HMAC", hmac.new(b"auth-token", digestmod=hashlib.sha1))
+    body = b'{"call_sid": "CS1"}'
+    url = "http://testserver/telephony/webhook?bodySHA256=" + hashlib.sha256(body).hexdigest()
+    signature = base64.b64encode(hmac.new(b"auth-token", url.encode(), hashlib.sha1).digest()).decode()
+    headers = {"content-type": "application/json"}
+
+    r = client.post(url, content=body, headers={**headers, "x-twilio-signature": signature})
+    assert r.status_code == 200
+
+    r = client.post(url, content=body, headers={**headers, "x-twilio-signature": "bm90LXRoZS1zaWc="})
+    assert r.status_code == 403
+
+    # body does not match the signed hash
+    r = client.post(url, content=b'{"call_sid": "CS2"}', headers={**headers, "x-twilio-signature": signature})
+    assert r.status_code == 403
+
+    # a valid signature over a URL without bodySHA256 leaves the body unsigned
+    bare_url = "http://testserver/telephony/webhook"
+    bare_signature = base64.b64encode(hmac.new(b"auth-token", bare_url.encode(), hashlib.sha1).digest()).decode()
+    r = client.post(bare_url, content=b'{"call_sid": "ATTACKER"}', headers={**headers, "x-twilio-signature": bare_signature})
+    assert r.status_code == 403
+
+def test_twilio_webhook_signature_uses_public_base_url(client, monkeypatch):
+    import base64
+    import hashlib
+    import hmac
+    from nyra_realtime import telephony
+
+    monkeypatch.setattr(telephony, "_TWILIO_HMAC", hmac.new(b"auth-token", digestmod=hashlib.sha1))
+    monkeypatch.setattr(telephony, "_PUBLIC_BASE_URL", "https://nyra.example.com")
+    body = b'{"call_sid": "CS1"}'
+    query = "?bodySHA256=" + hashlib.sha256(body).hexdigest()
+    # Twilio signs the public https URL; the app itself is reached over http
+    public_url = "https://nyra.example.com/telephony/webhook" + query
+    signature = base64.b64encode(hmac.new(b"auth-token", public_url.encode(), hashlib.sha1).digest()).decode()
+    headers = {"content-type": "application/json", "x-twilio-signature": signature}
+
+    r = client.post("http://testserver/telephony/webhook" + query, content=body, headers=headers)
+    assert r.status_code == 200
@@ -0,0 +1,40 @@
+import asyncio
+import json
+import stat
+from pathlib import Path
+
+import pytest
+
+from nyra_realtime import chronicle
+from nyra_realtime.chronicle import TranscriptStore
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_ingest_writes_private_json_transcript(tmp_path: Path, monkeypatch, use_orjson):
+    monkeypatch.setattr(chronicle, "BASE", tmp_path)
+    if not use_orjson:
+        monkeypatch.setattr(chronicle, "orjson", None)
+    store = TranscriptStore()
+    payload = store.format_transcript(
+        "CS1",
+        [{"role": "caller", "text": "hello — \"there\""}, {"role": "nyra", "text": "hi"}],
+        {"duration_ms": 1200, "tags": []},
+    )
+
+    # no endpoint configured -> falls back to the local store
+    asyncio.run(store.ingest("CS1", payload))
+
+    path = tmp_path / "CS1.json"
+    assert json.loads(path.read_bytes()) == payload
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_save_local_only_writes_items_when_present(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(chronicle, "BASE", tmp_path)
+    store = TranscriptStore()
+
+    asyncio.run(store.save_local("CS2", {"call_id": "CS2"}))
+    assert json.loads((tmp_path / "CS2.json").read_bytes()) == {"call_id": "CS2"}
+
+    asyncio.run(store.save_local("CS3", {}))
+    assert json.loads((tmp_path / "CS3.json").read_bytes()) == {}
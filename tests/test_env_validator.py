@@ -1,38 +1,47 @@
 import os
-import tempfile
-import subprocess
 from pathlib import Path
 
+import pytest
 
-def run_validator(tmp_env_content: str | None):
-    repo = Path(__file__).resolve().parents[1]
-    env_path = repo / ".env.local"
-    # create or clean
-    if env_path.exists():
-        env_path.unlink()
-    if tmp_env_content is not None:
-        env_path.write_text(tmp_env_content)
+from nyra_realtime._dotenv_cache import load_env_once
+from scripts.validate_env import REQUIRED_KEYS, main
 
-    # run the script
-    import sys
-    proc = subprocess.run([sys.executable, "scripts/validate_env.py"], cwd=str(repo), capture_output=True, text=True)
+_ENV_AT_IMPORT = {k: os.environ.get(k) for k in REQUIRED_KEYS}
 
-    # cleanup
-    if env_path.exists():
-        env_path.unlink()
 
-    return proc.returncode, proc.stdout, proc.stderr
+@pytest.fixture
+def run_validator(tmp_path: Path, monkeypatch, capsys):
+    def run(env_content: str):
+        # point the validator at a scratch .env.local and a clean environment
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".env.local").write_text(env_content)
+        for key in REQUIRED_KEYS:
+            # setenv first so monkeypatch records the original state and removes
+            # whatever load_dotenv writes once the test is over
+            monkeypatch.setenv(key, "")
+            monkeypatch.delenv(key)
+        load_env_once.cache_clear()
+        code = main([])
+        return code, capsys.readouterr().out
 
+    yield run
+    load_env_once.cache_clear()
 
-def test_validator_fails_on_missing():
+
+def test_validator_fails_on_missing(run_validator):
     # empty file -> missing all required
-    code, out, err = run_validator("")
+    code, out = run_validator("")
     assert code == 1
     assert "Missing required environment variables" in out
 
 
-def test_validator_passes_when_present():
+def test_validator_passes_when_present(run_validator):
     content = "OPENAI_API_KEY=abc\nTWILIO_ACCOUNT_SID=1\nTWILIO_AUTH_TOKEN=2\nADMIN_TOKEN=3\n"
-    code, out, err = run_validator(content)
+    code, out = run_validator(content)
     assert code == 0
     assert "All required environment variables" in out
+
+
+def test_validator_tests_restore_environment():
+    # runs after the tests above: whatever load_dotenv set must have been undone
+    assert {k: os.environ.get(k) for k in REQUIRED_KEYS} == _ENV_AT_IMPORT
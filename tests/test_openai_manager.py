@@ -1,7 +1,9 @@
 import asyncio
 import time
 
-from nyra_realtime.openai_manager import OpenAIRealtimeManager
+import pytest
+
+from nyra_realtime.openai_manager import OpenAIRealtimeManager, bootstrap
 
 
 class MockWebSocket:
@@ -11,8 +13,6 @@ class MockWebSocket:
         self.closed = False
 
     async def send(self, data: bytes):
-        # emulate a short send delay
-        await asyncio.sleep(0)
         self.send_buffer.append(data)
 
     async def recv(self):
@@ -23,10 +23,6 @@ class MockWebSocket:
         self.closed = True
 
 
-def _sync_run(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
-
-
 def test_connect_and_disconnect():
     ws = MockWebSocket()
 
@@ -34,11 +30,15 @@ def test_connect_and_disconnect():
         return ws
 
     mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory)
-    _sync_run(mgr.connect())
-    assert mgr.connected is True
 
-    _sync_run(mgr.disconnect())
-    assert mgr.connected is False
+    async def scenario():
+        await mgr.connect()
+        assert mgr.connected is True
+
+        await mgr.disconnect()
+        assert mgr.connected is False
+
+    asyncio.run(scenario())
 
 
 def test_send_and_receive():
@@ -48,7 +48,6 @@ def test_send_and_receive():
         return ws
 
     mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory)
-    loop = asyncio.get_event_loop()
 
     async def scenario():
         await mgr.connect()
@@ -67,15 +66,18 @@ def test_send_and_receive():
 
         await mgr.disconnect()
 
-    loop.run_until_complete(scenario())
+    asyncio.run(scenario())
 
 
 def test_reconnect_behavior():
     # factory that fails twice then succeeds
     calls = {"n": 0}
+    third_attempt = asyncio.Event()
 
     async def factory():
         calls["n"] += 1
+        if calls["n"] == 3:
+            third_attempt.set()
         if calls["n"] <= 2:
             raise ConnectionError("simulated connect failure")
         return MockWebSocket()
@@ -84,15 +86,193 @@ def test_reconnect_behavior():
     mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory, reconnect_backoff=[0.01, 0.01])
 
     async def runner():
-        # run run_forever in background and stop after a short window
+        # run run_forever in background and stop once it has retried past the failures
         task = asyncio.create_task(mgr.run_forever(stop))
-        # give it time to attempt connects
-        await asyncio.sleep(0.08)
+        await asyncio.wait_for(third_attempt.wait(), timeout=1.0)
         stop.set()
         await task
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(runner())
+    asyncio.run(runner())
 
     # we expect at least 3 attempts (2 failures then success or more attempts)
     assert mgr._connect_attempts >= 3
+
+
+def test_send_queue_overflow_policy():
+    async def scenario():
+        mgr = OpenAIRealtimeManager(api_key="ok", send_hwm=2)
+        for frame in (b"1", b"2", b"3"):
+            await mgr.send_audio(frame)
+        # the oldest frame was dropped to make room for the newest
+        assert [mgr._send_queue.get_nowait() for _ in range(2)] == [b"2", b"3"]
+
+        strict = OpenAIRealtimeManager(api_key="ok", send_hwm=1, drop_oldest=False)
+        await strict.send_audio(b"1")
+        with pytest.raises(asyncio.QueueFull):
+            await strict.send_audio(b"2")
+
+    asyncio.run(scenario())
+
+
+def test_receive_buffer_applies_backpressure():
+    ws = MockWebSocket()
+
+    async def factory():
+        return ws
+
+    async def scenario():
+        mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory, recv_hwm=2)
+        await mgr.connect()
+        for frame in (b"1", b"2", b"3"):
+            ws.recv_queue.put_nowait(frame)
+        await asyncio.sleep(0.01)
+        # the receiver stops reading from the transport once the buffer is full
+        assert list(mgr._recv_buf) == [b"1", b"2"]
+        assert ws.recv_queue.qsize() == 1
+
+        assert [await mgr.receive_voice(timeout=1.0) for _ in range(3)] == [b"1", b"2", b"3"]
+        with pytest.raises(asyncio.TimeoutError):
+            await mgr.receive_voice(timeout=0.01)
+        await mgr.disconnect()
+
+    asyncio.run(scenario())
+
+
+def test_callback_only_consumer_keeps_receiving():
+    ws = MockWebSocket()
+
+    async def factory():
+        return ws
+
+    seen = []
+
+    async def scenario():
+        mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory, recv_hwm=4)
+        mgr.register_on_message(seen.append)
+        await mgr.connect()
+        frames = [str(i).encode() for i in range(50)]
+        for frame in frames:
+            ws.recv_queue.put_nowait(frame)
+
+        async def socket_drained():
+            while not ws.recv_queue.empty():
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(socket_drained(), timeout=1.0)
+        await asyncio.sleep(0)
+        # nobody calls receive_voice, so the buffer sheds old frames instead of blocking
+        assert seen == frames
+        assert list(mgr._recv_buf) == frames[-4:]
+        await mgr.disconnect()
+
+    asyncio.run(scenario())
+
+
+def test_on_message_callbacks_are_isolated():
+    ws = MockWebSocket()
+
+    async def factory():
+        return ws
+
+    seen = []
+
+    def broken(data: bytes):
+        raise ValueError("callback bug")
+
+    async def scenario():
+        mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory)
+        mgr.register_on_message(broken)
+        mgr.register_on_message(seen.append)
+        await mgr.connect()
+        await ws.recv_queue.put(b"tts-frame")
+        assert await mgr.receive_voice(timeout=1.0) == b"tts-frame"
+        # a failing callback neither stops the others nor drops the connection
+        assert seen == [b"tts-frame"]
+        assert mgr.connected is True
+        await mgr.disconnect()
+
+    asyncio.run(scenario())
+
+
+def test_run_forever_reconnects_after_remote_close():
+    sockets = []
+    reconnected = asyncio.Event()
+
+    async def factory():
+        sockets.append(MockWebSocket())
+        if len(sockets) == 2:
+            reconnected.set()
+        return sockets[-1]
+
+    async def runner():
+        stop = asyncio.Event()
+        mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory)
+        task = asyncio.create_task(mgr.run_forever(stop))
+        while not sockets:
+            await asyncio.sleep(0)
+        # remote end closes the first connection
+        await sockets[0].recv_queue.put(None)
+        await asyncio.wait_for(reconnected.wait(), timeout=1.0)
+        stop.set()
+        await task
+        assert mgr.connected is False
+
+    asyncio.run(runner())
+
+
+def test_send_failure_tears_down_both_loops():
+    class FailingSendWebSocket(MockWebSocket):
+        async def send(self, data: bytes):
+            raise ConnectionError("simulated send failure")
+
+    ws = FailingSendWebSocket()
+
+    async def factory():
+        return ws
+
+    errors = []
+
+    async def scenario():
+        mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory)
+        mgr.register_on_disconnected(errors.append)
+        await mgr.connect()
+        io_task = mgr._io_task
+        await mgr.send_audio(b"hello")
+        await asyncio.wait_for(io_task, timeout=1.0)
+        assert mgr.connected is False
+        await mgr.disconnect()
+
+    asyncio.run(scenario())
+    # one notification for the failure, one for the explicit disconnect
+    assert isinstance(errors[0], ConnectionError)
+    assert errors[1:] == [None]
+
+
+def test_coalesce_frames_sends_batch_in_one_call():
+    ws = MockWebSocket()
+
+    async def factory():
+        return ws
+
+    async def scenario():
+        mgr = OpenAIRealtimeManager(api_key="ok", ws_factory=factory, coalesce_frames=True)
+        # queue a burst before the sender loop gets to run
+        for frame in (b"a", b"b", b"c"):
+            await mgr.send_audio(frame)
+        await mgr.connect()
+        await asyncio.sleep(0.01)
+        assert ws.send_buffer == [[b"a", b"b", b"c"]]
+        await mgr.disconnect()
+
+    asyncio.run(scenario())
+
+
+def test_bootstrap_returns_result_without_touching_loop_policy():
+    policy = asyncio.get_event_loop_policy()
+
+    async def main():
+        await asyncio.sleep(0)
+        return 42
+
+    assert bootstrap(main()) == 42
+    assert asyncio.get_event_loop_policy() is policy
@@ -0,0 +1,125 @@
+import asyncio
+import socket
+from types import SimpleNamespace
+
+import pytest
+import websockets
+
+from nyra_realtime import openai_transport
+from fastapi import HTTPException
+
+from nyra_realtime.openai_transport import get_openai_ws_factory, lifespan, make_openai_ws_factory
+
+
+async def _echo(ws):
+    async for message in ws:
+        await ws.send(message)
+
+
+def test_factory_caches_resolution_until_connect_fails(monkeypatch):
+    monkeypatch.setattr(openai_transport, "_DNS_CACHE", {})
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        lookups = []
+        real_getaddrinfo = loop.getaddrinfo
+
+        async def counting_getaddrinfo(*args, **kwargs):
+            lookups.append(args[:2])
+            return await real_getaddrinfo(*args, **kwargs)
+
+        loop.getaddrinfo = counting_getaddrinfo
+
+        server = await websockets.serve(_echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        factory = make_openai_ws_factory("key", url=f"ws://127.0.0.1:{port}")
+        for _ in range(2):
+            ws = await factory()
+            await ws.send(b"ping")
+            assert await ws.recv() == b"ping"
+            await ws.close()
+        # the second connect reused the cached address
+        assert lookups == [("127.0.0.1", port)]
+
+        server.close()
+        await server.wait_closed()
+        with pytest.raises(OSError):
+            await factory()
+        # a failed connect drops the cached entry
+        assert openai_transport._DNS_CACHE == {}
+
+    asyncio.run(scenario())
+
+
+def test_factory_falls_back_to_next_resolved_address(monkeypatch):
+    monkeypatch.setattr(openai_transport, "_DNS_CACHE", {})
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        server = await websockets.serve(_echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        # dual-stack host whose first (IPv6) address refuses connections
+        async def dual_stack_getaddrinfo(host, port, **kwargs):
+            return [
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", port, 0, 0)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port)),
+            ]
+
+        loop.getaddrinfo = dual_stack_getaddrinfo
+
+        factory = make_openai_ws_factory("key", url=f"ws://realtime.test:{port}")
+        for _ in range(2):
+            ws = await factory()
+            await ws.send(b"ping")
+            assert await ws.recv() == b"ping"
+            await ws.close()
+            # the working address is tried first from then on
+            assert openai_transport._DNS_CACHE[("realtime.test", port)][1] == ("127.0.0.1", "::1")
+
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+class _FakeSocket:
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_lifespan_closes_sockets_from_shared_factory(monkeypatch):
+    monkeypatch.setattr(openai_transport.settings, "OPENAI_API_KEY", "key")
+
+    def fake_make_factory(api_key, url=None):
+        async def connect():
+            return _FakeSocket()
+
+        return connect
+
+    monkeypatch.setattr(openai_transport, "make_openai_ws_factory", fake_make_factory)
+    app = SimpleNamespace(state=SimpleNamespace())
+    conn = SimpleNamespace(app=app)
+
+    async def scenario():
+        async with lifespan(app):
+            ws = await get_openai_ws_factory(conn)()
+            assert not ws.closed
+        assert ws.closed
+
+    asyncio.run(scenario())
+
+
+def test_shared_factory_unavailable_without_api_key(monkeypatch):
+    monkeypatch.setattr(openai_transport.settings, "OPENAI_API_KEY", None)
+    app = SimpleNamespace(state=SimpleNamespace())
+
+    async def scenario():
+        async with lifespan(app):
+            with pytest.raises(HTTPException) as excinfo:
+                get_openai_ws_factory(SimpleNamespace(app=app))
+            assert excinfo.value.status_code == 503
+
+    asyncio.run(scenario())
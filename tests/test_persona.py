@@ -0,0 +1,81 @@
+import copy
+import dataclasses
+import os
+from pathlib import Path
+
+from nyra_realtime.persona import DEFAULT_PERSONA, load_personas
+
+
+PERSONAS = """\
+default:
+  name: Nyra
+  description: "Nyra, AI assistant."
+  voice:
+    style: warm
+  mode: assistant
+"""
+
+
+def test_load_personas_missing_file_returns_default(tmp_path: Path):
+    assert load_personas(str(tmp_path / "missing.yaml")) == {"default": DEFAULT_PERSONA}
+
+
+def test_load_personas_empty_file_returns_default(tmp_path: Path):
+    p = tmp_path / "personas.yaml"
+    p.touch()
+    assert load_personas(str(p)) == {"default": DEFAULT_PERSONA}
+
+    p.write_text("# no personas configured yet\n")
+    assert load_personas(str(p)) == {"default": DEFAULT_PERSONA}
+
+
+def test_load_personas_reloads_after_edit(tmp_path: Path):
+    p = tmp_path / "personas.yaml"
+    p.write_text(PERSONAS)
+
+    first = load_personas(str(p))
+    assert first["default"].name == "Nyra"
+    # repeated loads hit the cache but still hand out a fresh mapping
+    again = load_personas(str(p))
+    assert again == first and again is not first
+
+    p.write_text(PERSONAS + """\
+legal:
+  name: Nyra-Legal
+  description: "Nyra in Legal Mode."
+  mode: legal
+""")
+    assert set(load_personas(str(p))) == {"default", "legal"}
+
+
+def test_load_personas_relative_path_is_per_directory(tmp_path: Path, monkeypatch):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "personas.yaml").write_text(PERSONAS)
+    (tmp_path / "b" / "personas.yaml").write_text(PERSONAS.replace("name: Nyra", "name: Nora"))
+    # same size and mtime, so only the cache key can tell the two files apart
+    for d in ("a", "b"):
+        os.utime(tmp_path / d / "personas.yaml", ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert load_personas("personas.yaml")["default"].name == "Nyra"
+    monkeypatch.chdir(tmp_path / "b")
+    assert load_personas("personas.yaml")["default"].name == "Nora"
+
+
+def test_cached_persona_voice_is_not_shared(tmp_path: Path):
+    p = tmp_path / "personas.yaml"
+    p.write_text(PERSONAS)
+
+    persona = load_personas(str(p))["default"]
+    persona.voice["style"] = "cold"
+    assert load_personas(str(p))["default"].voice == {"style": "warm"}
+    # personas stay plain data that serializes
+    assert dataclasses.asdict(persona)["voice"] == {"style": "cold"}
+    assert copy.deepcopy(persona) == persona
+
+
+def test_load_personas_ignores_unknown_keys(tmp_path: Path):
+    p = tmp_path / "personas.yaml"
+    p.write_text(PERSONAS + "  greeting: Hello!\n")
+    assert load_personas(str(p))["default"].name == "Nyra"